@@ -253,11 +253,20 @@ def form_dependencies(form):
 
 
 def form_key(form):
-    form = replaced_form(form)
-    form = ufl.algorithms.expand_derivatives(form)
-    form = ufl.algorithms.expand_compounds(form)
-    form = ufl.algorithms.expand_indices(form)
-    return form
+    if "_tlm_adjoint__form_key" not in form._cache:
+        key = replaced_form(form)
+        key = ufl.algorithms.expand_derivatives(key)
+        key = ufl.algorithms.expand_compounds(key)
+        key = ufl.algorithms.expand_indices(key)
+        form._cache["_tlm_adjoint__form_key"] = key
+    return form._cache["_tlm_adjoint__form_key"]
+
+
+def remove_complex_nodes(form):
+    if "_tlm_adjoint__real_form" not in form._cache:
+        form._cache["_tlm_adjoint__real_form"] = \
+            ufl.algorithms.remove_complex_nodes.remove_complex_nodes(form)
+    return form._cache["_tlm_adjoint__real_form"]
 
 
 def assemble_key(form, bcs, assemble_kwargs):
@@ -288,7 +297,7 @@ class AssemblyCache(Cache):
 
         form = eliminate_zeros(form, force_non_empty_form=True)
         if not complex_mode:
-            form = ufl.algorithms.remove_complex_nodes.remove_complex_nodes(form)  # noqa: E501
+            form = remove_complex_nodes(form)
         rank = len(form.arguments())
         assemble_kwargs = assemble_arguments(rank, form_compiler_parameters,
                                              linear_solver_parameters)
@@ -341,7 +350,7 @@ class LinearSolverCache(Cache):
 
         form = eliminate_zeros(form, force_non_empty_form=True)
         if not complex_mode:
-            form = ufl.algorithms.remove_complex_nodes.remove_complex_nodes(form)  # noqa: E501
+            form = remove_complex_nodes(form)
         key = linear_solver_key(form, bcs, linear_solver_parameters,
                                 form_compiler_parameters)
 
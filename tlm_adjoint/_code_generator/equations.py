@@ -41,7 +41,6 @@ from .caches import assembly_cache, form_neg, is_cached, linear_solver_cache, \
 from .functions import bcs_is_cached, bcs_is_homogeneous, bcs_is_static, \
     eliminate_zeros, extract_coefficients
 
-import copy
 import numpy as np
 import ufl
 import warnings
@@ -830,8 +829,8 @@ class DirichletBCSolver(Equation):
         check_space_type(y, "primal")
 
         super().__init__(x, [x, y], nl_deps=[], ic=False, adj_ic=False)
-        self._bc_args = copy.copy(args)
-        self._bc_kwargs = copy.copy(kwargs)
+        self._bc_args = args
+        self._bc_kwargs = kwargs
 
     def forward_solve(self, x, deps=None):
         _, y = self.dependencies() if deps is None else deps
@@ -582,11 +582,14 @@ def replaced_expr(expr):
 
 
 def replaced_form(form):
-    replace_map = {}
-    for c in form.coefficients():
-        if is_function(c):
-            replace_map[c] = function_replacement(c)
-    return ufl.replace(form, replace_map)
+    if "_tlm_adjoint__replaced_form" not in form._cache:
+        replace_map = {}
+        for c in form.coefficients():
+            if is_function(c):
+                replace_map[c] = function_replacement(c)
+        form._cache["_tlm_adjoint__replaced_form"] = \
+            ufl.replace(form, replace_map)
+    return form._cache["_tlm_adjoint__replaced_form"]
 
 
 def define_function_alias(x, parent, *, key):
@@ -20,6 +20,9 @@
 
 from .checkpointing import CheckpointingManager
 
+import functools
+import heapq
+
 __all__ = \
     [
         "MultistageCheckpointingManager",
@@ -54,6 +57,11 @@ def n_advance(n, snapshots, *, trajectory="maximum"):
     elif snapshots == n - 1:
         return 1  # Maximal storage
 
+    return _n_advance(n, snapshots, trajectory)
+
+
+@functools.lru_cache(maxsize=None)
+def _n_advance(n, snapshots, trajectory):
     # Find t as in GW2000 Proposition 1 (note 'm' in GW2000 is 'n' here, and
     # 's' in GW2000 is 'snapshots' here). Compute values of beta as in equation
     # (1) of GW2000 as a side effect. We must have a minimal rerun of at least
@@ -141,8 +149,8 @@ def allocate_snapshots(max_n, snapshots_in_ram, snapshots_on_disk, *,
     assert snapshot_i == -1
 
     allocation = ["disk" for i in range(snapshots)]
-    for i in [p[0] for p in sorted(enumerate(weights), key=lambda p: p[1],
-                                   reverse=True)][:snapshots_in_ram]:
+    for i in heapq.nlargest(snapshots_in_ram, range(snapshots),
+                            key=weights.__getitem__):
         allocation[i] = "RAM"
 
     return tuple(weights), tuple(allocation)
@@ -290,11 +298,11 @@ class MultistageCheckpointingManager(CheckpointingManager):
 
     def _snapshot(self, n):
         assert n >= 0 and n < self._max_n
-        if len(self._snapshots) >= \
-                self._snapshots_in_ram + self._snapshots_on_disk:
+        i = len(self._snapshots)
+        if i >= self._snapshots_in_ram + self._snapshots_on_disk:
             raise RuntimeError("Invalid checkpointing state")
         self._snapshots.append(n)
-        return self._storage[len(self._snapshots) - 1]
+        return self._storage[i]
 
 
 class TwoLevelCheckpointingManager(CheckpointingManager):
@@ -145,8 +145,8 @@ class Cache:
         if deps is None:
             deps = []
 
-        if key in self._cache:
-            value_ref = self._cache[key]
+        value_ref = self._cache.get(key, None)
+        if value_ref is not None:
             value = value_ref()
             if value is None:
                 raise RuntimeError("Unexpected cache value state")
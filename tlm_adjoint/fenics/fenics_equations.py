@@ -31,7 +31,7 @@ from ..caches import Cache
 from ..equations import Equation, LinearEquation, Matrix, MatrixActionRHS, \
     NullSolver, get_tangent_linear
 
-from .caches import form_dependencies, form_key
+from .caches import form_dependencies, form_key, remove_complex_nodes
 from .equations import EquationSolver, bind_form, derivative, unbind_form, \
     unbound_form
 from .functions import eliminate_zeros
@@ -217,7 +217,7 @@ class LocalSolverCache(Cache):
 
         form = eliminate_zeros(form, force_non_empty_form=True)
         assert not complex_mode
-        form = ufl.algorithms.remove_complex_nodes.remove_complex_nodes(form)
+        form = remove_complex_nodes(form)
         key = local_solver_key(form, solver_type)
 
         def value():
@@ -395,9 +395,9 @@ def interpolation_matrix(x_coords, y, y_cells, y_colors):
     for y_node, color in enumerate(y_colors):
         y_nodes[color].append(y_node)
 
-    from scipy.sparse import dok_matrix
-    P = dok_matrix((x_coords.shape[0], function_local_size(y)),
-                   dtype=backend_ScalarType)
+    P_rows = []
+    P_cols = []
+    P_data = []
 
     y_v = function_new(y)
     for color, y_color_nodes in enumerate(y_nodes):
@@ -418,9 +418,16 @@ def interpolation_matrix(x_coords, y, y_cells, y_colors):
             y_node = y_cell_nodes[i]
             x_v = np.full((1,), np.NAN, dtype=backend_ScalarType)
             y_v.eval_cell(x_v, x_coords[x_node, :], Cell(y_mesh, y_cell))
-            P[x_node, y_node] = x_v[0]
+            P_rows.append(x_node)
+            P_cols.append(y_node)
+            P_data.append(x_v[0])
         y_v.vector()[y_color_nodes] = 0.0
 
+    from scipy.sparse import coo_matrix
+    P = coo_matrix((np.array(P_data, dtype=backend_ScalarType),
+                    (np.array(P_rows, dtype=np.int64),
+                     np.array(P_cols, dtype=np.int64))),
+                   shape=(x_coords.shape[0], function_local_size(y)))
     return P.tocsr()
 
 
@@ -428,7 +435,7 @@ class LocalMatrix(Matrix):
     def __init__(self, P):
         super().__init__(nl_deps=[], ic=False, adj_ic=False)
         self._P = P.copy()
-        self._P_T = P.T
+        self._P_T = self._P.T
 
     def forward_action(self, nl_deps, x, b, method="assign"):
         if method == "assign":
@@ -486,7 +493,8 @@ class InterpolationSolver(LinearEquation):
         y_colors   (Optional) An integer NumPy vector. Node-node graph coloring
                    for the space for y. Ignored if P is supplied. Generated
                    using greedy_coloring if not supplied.
-        P          (Optional) Interpolation matrix.
+        P          (Optional) Interpolation matrix. Copied, so that later
+                   modification of P does not affect the equation.
         tolerance  (Optional) Maximum distance of an interpolation point from
                    a cell. Ignored if P is supplied.
         """
@@ -523,8 +531,6 @@ class InterpolationSolver(LinearEquation):
                 y_colors = greedy_coloring(y_space)
 
             P = interpolation_matrix(x_coords, y, y_cells, y_colors)
-        else:
-            P = P.copy()
 
         super().__init__(
             MatrixActionRHS(LocalMatrix(P), y), x)
@@ -558,7 +564,8 @@ class PointInterpolationSolver(Equation):
                   using greedy_coloring if not supplied.
         y_cells   (Optional) An integer NumPy vector. The cells in the y mesh
                   containing each point. Ignored if P is supplied.
-        P         (Optional) Interpolation matrix.
+        P         (Optional) Interpolation matrix. Not copied, and must not
+                  be modified after the equation is constructed.
         tolerance  (Optional) Maximum distance of an interpolation point from
                    a cell. Ignored if P or y_cells are supplied.
         """
@@ -597,8 +604,6 @@ class PointInterpolationSolver(Equation):
                 y_colors = greedy_coloring(y_space)
 
             P = interpolation_matrix(X_coords, y, y_cells, y_colors)
-        else:
-            P = P.copy()
 
         super().__init__(X, list(X) + [y], nl_deps=[], ic=False, adj_ic=False)
         self._P = P
@@ -611,9 +616,7 @@ class PointInterpolationSolver(Equation):
 
         check_space_type(y, "primal")
         y_v = function_get_values(y)
-        x_v_local = np.full(len(X), np.NAN, dtype=backend_ScalarType)
-        for i in range(len(X)):
-            x_v_local[i] = self._P.getrow(i).dot(y_v)
+        x_v_local = np.asarray(self._P.dot(y_v), dtype=backend_ScalarType)
 
         comm = function_comm(y)
         x_v = np.full(len(X), np.NAN, dtype=backend_ScalarType)
@@ -629,9 +632,9 @@ class PointInterpolationSolver(Equation):
         if dep_index < len(adj_X):
             return adj_X[dep_index]
         elif dep_index == len(adj_X):
-            adj_x_v = np.full(len(adj_X), np.NAN, dtype=backend_ScalarType)
-            for i, adj_x in enumerate(adj_X):
-                adj_x_v[i] = function_scalar_value(adj_x)
+            adj_x_v = np.fromiter(
+                (function_scalar_value(adj_x) for adj_x in adj_X),
+                dtype=backend_ScalarType, count=len(adj_X))
             F = function_new_conjugate_dual(self.dependencies()[-1])
             function_set_values(F, self._P_T.dot(adj_x_v))
             return (-1.0, F)
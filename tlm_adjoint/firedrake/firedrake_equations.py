@@ -31,7 +31,8 @@ from .backend_code_generator_interface import assemble, complex_mode, \
 from ..caches import Cache
 from ..equations import Equation, NullSolver, get_tangent_linear
 
-from .caches import form_dependencies, form_key, parameters_key
+from .caches import form_dependencies, form_key, parameters_key, \
+    remove_complex_nodes
 from .equations import EquationSolver, bind_form, derivative, unbind_form, \
     unbound_form
 from .functions import eliminate_zeros
@@ -83,7 +84,7 @@ class LocalSolverCache(Cache):
 
         form = eliminate_zeros(form, force_non_empty_form=True)
         if not complex_mode:
-            form = ufl.algorithms.remove_complex_nodes.remove_complex_nodes(form)  # noqa: E501
+            form = remove_complex_nodes(form)
         key = local_solver_key(form, form_compiler_parameters)
 
         def value():
@@ -205,13 +206,17 @@ class LocalProjectionSolver(EquationSolver):
                 defer_adjoint_assembly=self._defer_adjoint_assembly)
 
 
-def interpolation_matrix(x_coords, y, y_nodes, dtype=backend_ScalarType):
+def interpolation_matrix(x_coords, y, y_nodes, dtype=backend_ScalarType, *,
+                         lg_map=None):
     N = function_local_size(y)
-    lg_map = function_space(y).local_to_global_map([]).indices
+    if lg_map is None:
+        lg_map = function_space(y).local_to_global_map([]).indices
     gl_map = {g: l for l, g in enumerate(lg_map)}  # noqa: E741
 
-    from scipy.sparse import dok_matrix
-    P = dok_matrix((x_coords.shape[0], N), dtype=dtype)
+    P_indptr = np.zeros(x_coords.shape[0] + 1, dtype=np.int64)
+    P_indices = np.full(y_nodes.size, -1, dtype=np.int64)
+    P_data = np.full(y_nodes.size, np.NAN, dtype=dtype)
+    k = 0
 
     y_v = function_new(y)
     for x_node, x_coord in enumerate(x_coords):
@@ -224,13 +229,18 @@ def interpolation_matrix(x_coords, y, y_nodes, dtype=backend_ScalarType):
             if y_node in gl_map:
                 y_node_local = gl_map[y_node]
                 if y_node_local < N:
-                    P[x_node, y_node_local] = x_v
+                    P_indices[k] = y_node_local
+                    P_data[k] = x_v
+                    k += 1
             with y_v.dat.vec as y_v_v:
                 y_v_v.setValue(y_node, 0.0)
                 y_v_v.assemblyBegin()
                 y_v_v.assemblyEnd()
+        P_indptr[x_node + 1] = k
 
-    return P.tocsr()
+    from scipy.sparse import csr_matrix
+    return csr_matrix((P_data[:k].copy(), P_indices[:k].copy(), P_indptr),
+                      shape=(x_coords.shape[0], N))
 
 
 class PointInterpolationSolver(Equation):
@@ -247,7 +257,8 @@ class PointInterpolationSolver(Equation):
                    equation.
         X_coords   A NumPy matrix. Points at which to interpolate y.
                    Ignored if P is supplied, required otherwise.
-        P          (Optional) Interpolation matrix.
+        P          (Optional) Interpolation matrix. Not copied, and must not
+                   be modified after the equation is constructed.
         tolerance  (Optional) Cell containment tolerance, passed to the
                    MeshGeometry.locate_cell method. Ignored if P is supplied.
         """
@@ -298,8 +309,7 @@ class PointInterpolationSolver(Equation):
                     y_nodes_local[i, :] = -1
                 else:
                     assert y_cell >= 0
-                    for j, y_node in enumerate(y_cell_node_graph[y_cell, :]):
-                        y_nodes_local[i, j] = lg_map[y_node]
+                    y_nodes_local[i, :] = lg_map[y_cell_node_graph[y_cell, :]]
 
             y_nodes = np.full(y_nodes_local.shape, -1, dtype=np.int64)
             comm = function_comm(y)
@@ -307,14 +317,13 @@ class PointInterpolationSolver(Equation):
             if (y_nodes < 0).any():
                 raise RuntimeError("Unable to locate one or more cells")
 
-            P = interpolation_matrix(X_coords, y, y_nodes, dtype=dtype)
-        else:
-            P = P.copy()
+            P = interpolation_matrix(X_coords, y, y_nodes, dtype=dtype,
+                                     lg_map=lg_map)
 
         super().__init__(X, list(X) + [y], nl_deps=[], ic=False, adj_ic=False)
         self._dtype = dtype
         self._P = P
-        self._P_H = P.conjugate().T
+        self._P_H = None
 
     def forward_solve(self, X, deps=None):
         if is_function(X):
@@ -323,9 +332,7 @@ class PointInterpolationSolver(Equation):
 
         check_space_type(y, "primal")
         y_v = function_get_values(y)
-        x_v_local = np.full(len(X), np.NAN, dtype=self._dtype)
-        for i in range(len(X)):
-            x_v_local[i] = self._P.getrow(i).dot(y_v)
+        x_v_local = np.asarray(self._P.dot(y_v), dtype=self._dtype)
 
         comm = function_comm(y)
         x_v = np.full(len(X), np.NAN, dtype=self._dtype)
@@ -344,9 +351,14 @@ class PointInterpolationSolver(Equation):
         if dep_index < len(adj_X):
             return adj_X[dep_index]
         elif dep_index == len(adj_X):
-            adj_x_v = np.full(len(adj_X), np.NAN, dtype=self._dtype)
-            for i, adj_x in enumerate(adj_X):
-                adj_x_v[i] = function_scalar_value(adj_x)
+            adj_x_v = np.fromiter(
+                (function_scalar_value(adj_x) for adj_x in adj_X),
+                dtype=self._dtype, count=len(adj_X))
+            if self._P_H is None:
+                if issubclass(self._dtype, (complex, np.complexfloating)):
+                    self._P_H = self._P.conjugate().T
+                else:
+                    self._P_H = self._P.T
             F = function_new_conjugate_dual(self.dependencies()[-1])
             function_set_values(F, self._P_H.dot(adj_x_v))
             return (-1.0, F)
@@ -60,14 +60,21 @@ class HessianOptimization:
                                                   copy=False))
 
         nl_deps = {}
+        nl_deps_map = {}
         for n, block in enumerate(blocks):
             for i, eq in enumerate(block):
                 nl_deps[(n, i)] = manager._cp[(n, i)]
+                eq_nl_deps = eq.nonlinear_dependencies()
+                assert len(eq_nl_deps) == len(nl_deps[(n, i)])
+                nl_deps_map[(n, i)] = \
+                    {function_id(eq_dep): cp_dep
+                     for eq_dep, cp_dep in zip(eq_nl_deps, nl_deps[(n, i)])}
 
         self._comm = comm
         self._blocks = blocks
         self._ics = ics
         self._nl_deps = nl_deps
+        self._nl_deps_map = nl_deps_map
         self._cache_adjoint = cache_adjoint
         self._adj_cache = None
         if cache_adjoint:
@@ -110,13 +117,7 @@ class HessianOptimization:
         for tlm_dep in tlm_eq.initial_condition_dependencies():
             manager._cp.add_initial_condition(tlm_dep)
 
-        eq_nl_deps = eq.nonlinear_dependencies()
-        cp_deps = self._nl_deps[(n, i)]
-        assert len(eq_nl_deps) == len(cp_deps)
-        eq_deps = {function_id(eq_dep): cp_dep
-                   for eq_dep, cp_dep in zip(eq_nl_deps, cp_deps)}
-        del eq_nl_deps, cp_deps
-
+        eq_deps = self._nl_deps_map[(n, i)]
         tlm_deps = list(tlm_eq.dependencies())
         for j, tlm_dep in enumerate(tlm_deps):
             tlm_dep_id = function_id(tlm_dep)
@@ -212,19 +212,35 @@ class protecteddict(Mapping):  # noqa: N801
         self._d[key] = value
 
 
+_interface_classes = {}
+
+
+def _interface_class(obj_cls, interface_cls):
+    key = (obj_cls, interface_cls)
+    if key not in _interface_classes:
+        overrides = {}
+        for name in interface_cls.names:
+            attr_name = f"{interface_cls.prefix:s}{name:s}"
+            if hasattr(obj_cls, attr_name):
+                overrides[name] = getattr(obj_cls, attr_name)
+        if len(overrides) == 0:
+            _interface_classes[key] = interface_cls
+        else:
+            _interface_classes[key] = type(interface_cls.__name__,
+                                           (interface_cls,), overrides)
+    return _interface_classes[key]
+
+
 def add_interface(obj, interface_cls, attrs=None):
     if attrs is None:
         attrs = {}
 
+    # The interface class is stored on obj, and interface methods are called
+    # via this class with obj as the first argument. Methods overridden by
+    # the class of obj are handled by defining a derived interface class.
     interface_name = f"{interface_cls.prefix:s}"
     assert not hasattr(obj, interface_name)
-    setattr(obj, interface_name, interface_cls)
-
-    for name in interface_cls.names:
-        attr_name = f"{interface_cls.prefix:s}{name:s}"
-        if not hasattr(obj, attr_name):
-            setattr(obj, attr_name,
-                    weakref_method(getattr(interface_cls, name), obj))
+    setattr(obj, interface_name, _interface_class(type(obj), interface_cls))
 
     attrs_name = f"{interface_cls.prefix:s}_attrs"
     assert not hasattr(obj, attrs_name)
@@ -257,11 +273,15 @@ def is_space(x):
 
 
 def space_comm(space):
-    return space._tlm_adjoint__space_interface_comm()
+    comm = getattr(space, "_tlm_adjoint__space_interface_cached_comm", None)
+    if comm is None:
+        comm = space._tlm_adjoint__space_interface._comm(space)
+        space._tlm_adjoint__space_interface_cached_comm = comm
+    return comm
 
 
 def space_dtype(space):
-    return space._tlm_adjoint__space_interface_dtype()
+    return space._tlm_adjoint__space_interface._dtype(space)
 
 
 _space_id_counter = [0]
@@ -274,15 +294,19 @@ def new_space_id():
 
 
 def space_id(space):
-    return space._tlm_adjoint__space_interface_id()
+    id = getattr(space, "_tlm_adjoint__space_interface_cached_id", None)
+    if id is None:
+        id = space._tlm_adjoint__space_interface._id(space)
+        space._tlm_adjoint__space_interface_cached_id = id
+    return id
 
 
 def space_new(space, *, name=None, space_type="primal", static=False,
               cache=None, checkpoint=None):
     if space_type not in ["primal", "conjugate", "dual", "conjugate_dual"]:
         raise ValueError("Invalid space type")
-    return space._tlm_adjoint__space_interface_new(
-        name=name, space_type=space_type, static=static, cache=cache,
+    return space._tlm_adjoint__space_interface._new(
+        space, name=name, space_type=space_type, static=static, cache=cache,
         checkpoint=checkpoint)
 
 
@@ -479,20 +503,28 @@ def is_function(x):
 
 
 def function_comm(x):
-    return x._tlm_adjoint__function_interface_comm()
+    comm = getattr(x, "_tlm_adjoint__function_interface_cached_comm", None)
+    if comm is None:
+        comm = x._tlm_adjoint__function_interface._comm(x)
+        x._tlm_adjoint__function_interface_cached_comm = comm
+    return comm
 
 
 def function_space(x):
-    return x._tlm_adjoint__function_interface_space()
+    space = getattr(x, "_tlm_adjoint__function_interface_cached_space", None)
+    if space is None:
+        space = x._tlm_adjoint__function_interface._space(x)
+        x._tlm_adjoint__function_interface_cached_space = space
+    return space
 
 
 def function_space_type(x, *, rel_space_type="primal"):
-    space_type = x._tlm_adjoint__function_interface_space_type()
+    space_type = x._tlm_adjoint__function_interface._space_type(x)
     return relative_space_type(space_type, rel_space_type)
 
 
 def function_dtype(x):
-    return x._tlm_adjoint__function_interface_dtype()
+    return x._tlm_adjoint__function_interface._dtype(x)
 
 
 _function_id_counter = [0]
@@ -505,37 +537,41 @@ def new_function_id():
 
 
 def function_id(x):
-    return x._tlm_adjoint__function_interface_id()
+    id = getattr(x, "_tlm_adjoint__function_interface_cached_id", None)
+    if id is None:
+        id = x._tlm_adjoint__function_interface._id(x)
+        x._tlm_adjoint__function_interface_cached_id = id
+    return id
 
 
 def function_name(x):
-    return x._tlm_adjoint__function_interface_name()
+    return x._tlm_adjoint__function_interface._name(x)
 
 
 def function_state(x):
-    return x._tlm_adjoint__function_interface_state()
+    return x._tlm_adjoint__function_interface._state(x)
 
 
 def function_update_state(*X):
     for x in X:
-        x._tlm_adjoint__function_interface_update_state()
+        x._tlm_adjoint__function_interface._update_state(x)
     function_update_caches(*X)
 
 
 def function_is_static(x):
-    return x._tlm_adjoint__function_interface_is_static()
+    return x._tlm_adjoint__function_interface._is_static(x)
 
 
 def function_is_cached(x):
-    return x._tlm_adjoint__function_interface_is_cached()
+    return x._tlm_adjoint__function_interface._is_cached(x)
 
 
 def function_is_checkpointed(x):
-    return x._tlm_adjoint__function_interface_is_checkpointed()
+    return x._tlm_adjoint__function_interface._is_checkpointed(x)
 
 
 def function_caches(x):
-    return x._tlm_adjoint__function_interface_caches()
+    return x._tlm_adjoint__function_interface._caches(x)
 
 
 def function_update_caches(*X, value=None):
@@ -553,62 +589,75 @@ def function_update_caches(*X, value=None):
 
 
 def function_zero(x):
-    x._tlm_adjoint__function_interface_zero()
+    x._tlm_adjoint__function_interface._zero(x)
     function_update_state(x)
 
 
 def function_assign(x, y):
     if is_function(y):
         check_space_types(x, y)
-    x._tlm_adjoint__function_interface_assign(y)
+    x._tlm_adjoint__function_interface._assign(x, y)
     function_update_state(x)
 
 
 def function_axpy(y, alpha, x, /):
     if is_function(x):
         check_space_types(y, x)
-    y._tlm_adjoint__function_interface_axpy(alpha, x)
+    y._tlm_adjoint__function_interface._axpy(y, alpha, x)
     function_update_state(y)
 
 
 def function_inner(x, y):
     if is_function(y):
         check_space_types_conjugate_dual(x, y)
-    return x._tlm_adjoint__function_interface_inner(y)
+    return x._tlm_adjoint__function_interface._inner(x, y)
 
 
 def function_max_value(x):
     warnings.warn("function_max_value is deprecated",
                   DeprecationWarning, stacklevel=2)
-    return x._tlm_adjoint__function_interface_max_value()
+    return x._tlm_adjoint__function_interface._max_value(x)
 
 
 def function_sum(x):
-    return x._tlm_adjoint__function_interface_sum()
+    return x._tlm_adjoint__function_interface._sum(x)
 
 
 def function_linf_norm(x):
-    return x._tlm_adjoint__function_interface_linf_norm()
+    return x._tlm_adjoint__function_interface._linf_norm(x)
 
 
 def function_local_size(x):
-    return x._tlm_adjoint__function_interface_local_size()
+    n = getattr(x, "_tlm_adjoint__function_interface_cached_local_size", None)
+    if n is None:
+        n = x._tlm_adjoint__function_interface._local_size(x)
+        x._tlm_adjoint__function_interface_cached_local_size = n
+    return n
 
 
 def function_global_size(x):
-    return x._tlm_adjoint__function_interface_global_size()
+    N = getattr(x, "_tlm_adjoint__function_interface_cached_global_size", None)
+    if N is None:
+        N = x._tlm_adjoint__function_interface._global_size(x)
+        x._tlm_adjoint__function_interface_cached_global_size = N
+    return N
 
 
 def function_local_indices(x):
-    return x._tlm_adjoint__function_interface_local_indices()
+    indices = getattr(
+        x, "_tlm_adjoint__function_interface_cached_local_indices", None)
+    if indices is None:
+        indices = x._tlm_adjoint__function_interface._local_indices(x)
+        x._tlm_adjoint__function_interface_cached_local_indices = indices
+    return indices
 
 
 def function_get_values(x):
-    return x._tlm_adjoint__function_interface_get_values()
+    return x._tlm_adjoint__function_interface._get_values(x)
 
 
 def function_set_values(x, values):
-    x._tlm_adjoint__function_interface_set_values(values)
+    x._tlm_adjoint__function_interface._set_values(x, values)
     function_update_state(x)
 
 
@@ -616,8 +665,8 @@ def function_new(x, *, name=None, static=False, cache=None, checkpoint=None,
                  rel_space_type="primal"):
     if rel_space_type not in ["primal", "conjugate", "dual", "conjugate_dual"]:
         raise ValueError("Invalid relative space type")
-    return x._tlm_adjoint__function_interface_new(
-        name=name, static=static, cache=cache, checkpoint=checkpoint,
+    return x._tlm_adjoint__function_interface._new(
+        x, name=name, static=static, cache=cache, checkpoint=checkpoint,
         rel_space_type=rel_space_type)
 
 
@@ -643,8 +692,8 @@ def function_new_conjugate_dual(x, *, name=None, static=False, cache=None,
 
 
 def function_copy(x, *, name=None, static=False, cache=None, checkpoint=None):
-    return x._tlm_adjoint__function_interface_copy(
-        name=name, static=static, cache=cache, checkpoint=checkpoint)
+    return x._tlm_adjoint__function_interface._copy(
+        x, name=name, static=static, cache=cache, checkpoint=checkpoint)
 
 
 def function_new_tangent_linear(x, *, name=None):
@@ -657,11 +706,11 @@ def function_new_tangent_linear(x, *, name=None):
 
 
 def function_replacement(x):
-    return x._tlm_adjoint__function_interface_replacement()
+    return x._tlm_adjoint__function_interface._replacement(x)
 
 
 def function_is_replacement(x):
-    return x._tlm_adjoint__function_interface_is_replacement()
+    return x._tlm_adjoint__function_interface._is_replacement(x)
 
 
 def is_real_function(x):
@@ -679,17 +728,17 @@ def real_function_value(x):
 
 
 def function_is_scalar(x):
-    return x._tlm_adjoint__function_interface_is_scalar()
+    return x._tlm_adjoint__function_interface._is_scalar(x)
 
 
 def function_scalar_value(x):
     if not function_is_scalar(x):
         raise ValueError("Invalid function")
-    return x._tlm_adjoint__function_interface_scalar_value()
+    return x._tlm_adjoint__function_interface._scalar_value(x)
 
 
 def function_is_alias(x):
-    return x._tlm_adjoint__function_interface_is_alias()
+    return x._tlm_adjoint__function_interface._is_alias(x)
 
 
 _subtract_adjoint_derivative_action = {}
@@ -702,7 +751,7 @@ def add_subtract_adjoint_derivative_action(backend, fn):
 
 def subtract_adjoint_derivative_action(x, y):
     for fn in _subtract_adjoint_derivative_action.values():
-        if fn(x, y) != NotImplemented:
+        if fn(x, y) is not NotImplemented:
             break
     else:
         if y is None:
@@ -761,7 +810,7 @@ def add_functional_term_eq(backend, fn):
 def functional_term_eq(term, x):
     for fn in _functional_term_eq.values():
         eq = fn(term, x)
-        if eq != NotImplemented:
+        if eq is not NotImplemented:
             return eq
     raise RuntimeError("Unexpected case encountered in functional_term_eq")
 
@@ -777,7 +826,7 @@ def add_time_system_eq(backend, fn):
 def time_system_eq(*args, **kwargs):
     for fn in _time_system_eq.values():
         eq = fn(*args, **kwargs)
-        if eq != NotImplemented:
+        if eq is not NotImplemented:
             return eq
     raise RuntimeError("Unexpected case encountered in time_system_eq")
 
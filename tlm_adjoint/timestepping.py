@@ -23,8 +23,6 @@ from .interface import function_id, is_function, space_new, time_system_eq
 from .alias import Alias
 from .equations import AssignmentSolver, Equation
 
-from collections import OrderedDict
-
 __all__ = \
     [
         "BaseTimeLevel",
@@ -137,7 +135,7 @@ class TimeLevels:
     def __init__(self, levels, cycle_map):
         levels = tuple(sorted(set(levels)))
         # Always assign to earlier time levels first in the cycle
-        cycle_map = OrderedDict(sorted(cycle_map.items(), key=lambda i: i[0]))
+        cycle_map = dict(sorted(cycle_map.items(), key=lambda i: i[0]))
 
         self._levels = levels
         self._cycle_map = cycle_map